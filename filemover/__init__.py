@@ -21,10 +21,35 @@ The CLI is built on top of :mod:`click` and exposes two subcommands
 ``move‑file`` and ``move‑folder``.  See ``filemover.cli`` for details.
 """
 
+from typing import TYPE_CHECKING
+
 __all__ = [
     "move_file",
     "move_folder",
     "update_imports",
+    "update_imports_many",
+    "ImportIndex",
 ]
 
-from .mover import move_file, move_folder, update_imports  # noqa: F401
\ No newline at end of file
+if TYPE_CHECKING:  # pragma: no cover
+    from .mover import (  # noqa: F401
+        ImportIndex,
+        move_file,
+        move_folder,
+        update_imports,
+        update_imports_many,
+    )
+
+
+def __getattr__(name: str):
+    """Lazily import the public API on first attribute access (PEP 562).
+
+    Importing :mod:`filemover.mover` pulls in :mod:`ast` and friends, which
+    is wasted work for invocations that never touch it (``--help``,
+    ``--version``).  Deferring the import keeps CLI startup fast.
+    """
+    if name in __all__:
+        from . import mover
+
+        return getattr(mover, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -21,8 +21,6 @@ import sys
 
 import click
 
-from .mover import move_file, move_folder
-
 
 def resolve_paths(
     src: str, dst: str, repo_root: str | None
@@ -101,6 +99,8 @@ def move_file_cmd(src: str, dst: str, repo_root: str | None) -> None:
     files that refer to the moved module will be updated to refer to its
     new location.
     """
+    from .mover import move_file
+
     src_path, dst_path, root = resolve_paths(src, dst, repo_root)
     # Ensure the source is a Python file
     if src_path.suffix != ".py":
@@ -143,6 +143,8 @@ def move_folder_cmd(src: str, dst: str, repo_root: str | None) -> None:
     inside the moved directory will be updated to point to the new
     package path.
     """
+    from .mover import move_folder
+
     src_path, dst_path, root = resolve_paths(src, dst, repo_root)
     if not src_path.is_dir():
         raise click.UsageError("move-folder expects SRC to be a directory")
@@ -18,26 +18,73 @@ search/replace; this avoids accidentally touching strings and comments.
 However, rewriting may simplify the formatting of an import statement (for
 instance by collapsing multi‑line imports onto a single line).  The
 semantics of the code will be preserved even if the exact style changes.
+Everything outside the rewritten statements is preserved byte for byte:
+files are read and written as raw bytes, so CRLF line endings in
+Windows‑authored sources survive a rewrite unchanged.
 """
 
 from __future__ import annotations
 
 import ast
+import errno
+import functools
 import os
-import shutil
-from dataclasses import dataclass
+import re
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 __all__ = [
     "move_file",
     "move_folder",
     "update_imports",
+    "update_imports_many",
     "compute_module_path",
+    "ImportIndex",
 ]
 
+#: Size of the reusable buffer the prefilter reads files into.  Almost
+#: every source file fits, so the scan phase allocates no per-file bytes
+#: object at all; larger files are scanned head-first and only then
+#: streamed in full.  Imports cluster near the top of a module, so most
+#: oversized files are also decided on this head alone.
+_SCAN_BUFFER_SIZE = 1 << 20
 
-def compute_module_path(repo_root: Path, file_path: Path) -> str:
+#: Minimum number of candidate files before update_imports farms the
+#: per-file work out to a process pool; below this the pool startup
+#: overhead outweighs the parallel parse speedup.
+_PARALLEL_THRESHOLD = 32
+
+#: Directory names that never contain project sources worth rewriting.
+#: Skipping them up front keeps the traversal from descending into VCS
+#: metadata, virtual environments and other large generated trees.
+_SKIP_DIRS = frozenset({
+    ".git",
+    ".hg",
+    ".svn",
+    ".tox",
+    ".venv",
+    "__pycache__",
+    "node_modules",
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def compute_module_path(
+    repo_root: Union[str, "os.PathLike[str]"],
+    file_path: Union[str, "os.PathLike[str]"],
+) -> str:
     """Return the dotted module path for a Python file relative to the repository root.
 
     The returned string is derived by removing the ``repo_root`` prefix from
@@ -49,25 +96,548 @@ def compute_module_path(repo_root: Path, file_path: Path) -> str:
 
     Parameters
     ----------
-    repo_root: Path
+    repo_root: str or os.PathLike
         The root directory of the repository.
-    file_path: Path
+    file_path: str or os.PathLike
         The path to a Python file within the repository.
 
     Returns
     -------
     str
         The module's dotted import path.
+
+    Raises
+    ------
+    ValueError
+        If ``file_path`` does not lie under ``repo_root``.
     """
-    relative = file_path.relative_to(repo_root)
+    # Plain string arithmetic: callers with long rename lists pass raw
+    # strings and skip Path object construction entirely.  Memoised so
+    # duplicated URIs across a rename batch cost a dict lookup.
+    relative = os.path.relpath(os.fspath(file_path), os.fspath(repo_root))
+    if relative.startswith(".."):
+        raise ValueError(f"{file_path!s} is not inside repository root {repo_root!s}")
     # Remove trailing .py if present; allow .pyw as well
-    if relative.suffix in {".py", ".pyw"}:
-        relative = relative.with_suffix("")
-    parts = relative.parts
-    return ".".join(parts)
+    stem, ext = os.path.splitext(relative)
+    if ext in {".py", ".pyw"}:
+        relative = stem
+    if os.altsep:
+        relative = relative.replace(os.altsep, os.sep)
+    return relative.replace(os.sep, ".")
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_cached(path_str: str, mtime_ns: int) -> ast.Module:
+    """Parse ``path_str`` into an AST, memoised on the file's mtime.
+
+    Repeated :func:`update_imports` calls (multi-move sessions, or an
+    index build followed by moves) would otherwise re-tokenise the same
+    unchanged files.  The ``mtime_ns`` key makes stale entries unreachable
+    as soon as a file is rewritten, and the LRU bound keeps memory use
+    fixed.  Parse failures are not cached; callers handle them per call.
+    """
+    # Call compile() with PyCF_ONLY_AST directly rather than going through
+    # the ast.parse wrapper: it skips the wrapper frame and its
+    # feature_version handling, and never tokenises type comments.
+    return compile(
+        Path(path_str).read_bytes(),
+        path_str,
+        "exec",
+        flags=ast.PyCF_ONLY_AST | ast.PyCF_ALLOW_TOP_LEVEL_AWAIT,
+        dont_inherit=True,
+    )
+
+
+def _iter_import_nodes(tree: ast.Module) -> Iterator[ast.stmt]:
+    """Yield every import statement reachable in ``tree``.
+
+    Unlike :func:`ast.walk`, which descends into every expression node,
+    this visits statements only: the blocks that can contain imports
+    (``if``/``try``/``with``/``match``, loops, function and class
+    bodies) are recursed into, while expression subtrees — the bulk of a
+    typical module — are never pushed.  The number of nodes visited is therefore proportional
+    to the number of statements rather than the size of the file, and
+    deferred imports inside functions are still found, matching what the
+    regex fast path rewrites.
+    """
+    stack = list(tree.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            yield node
+        elif isinstance(node, ast.If):
+            stack.extend(node.body)
+            stack.extend(node.orelse)
+        elif isinstance(node, _TRY_NODES):
+            stack.extend(node.body)
+            stack.extend(node.orelse)
+            stack.extend(node.finalbody)
+            for handler in node.handlers:
+                stack.extend(handler.body)
+        elif isinstance(node, (ast.With, ast.AsyncWith)):
+            stack.extend(node.body)
+        elif isinstance(
+            node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+        ):
+            stack.extend(node.body)
+        elif isinstance(node, (ast.For, ast.AsyncFor, ast.While)):
+            stack.extend(node.body)
+            stack.extend(node.orelse)
+        elif isinstance(node, _MATCH_NODES):
+            for case in node.cases:
+                stack.extend(case.body)
+
+
+# ast.TryStar (except*) only exists on Python 3.11+
+_TRY_NODES = (ast.Try, ast.TryStar) if hasattr(ast, "TryStar") else (ast.Try,)
+# ast.Match (match/case) only exists on Python 3.10+
+_MATCH_NODES = (ast.Match,) if hasattr(ast, "Match") else ()
+
+
+#: Signals that the regex fast path cannot handle a file and the AST
+#: rewriter must be used instead.  A false positive here is harmless — it
+#: merely routes the file through the slower, exact path.
+#:
+#: Every pattern here (and the rewrite pattern itself) is audited for
+#: linear runtime: anchors at line start, single character-class
+#: quantifiers, and no nested or overlapping quantifiers, so pathological
+#: inputs such as a line of thousands of spaces cannot trigger
+#: catastrophic backtracking.
+# Parenthesised, backslash-continued or compound (;) import statements.
+_AMBIG_IMPORT_RE = re.compile(rb"^[ \t]*(?:from|import)\b[^\n]*[(\\;]", re.M)
+# Plain ``import a, b`` statements naming several modules.
+_MULTI_ALIAS_RE = re.compile(rb"^[ \t]*import[ \t][^\n]*,", re.M)
+# Relative imports.
+_RELATIVE_IMPORT_RE = re.compile(rb"^[ \t]*from[ \t]+\.", re.M)
+# Imports inlined after a colon (``if x: import y``).
+_INLINE_IMPORT_RE = re.compile(rb":[ \t]*(?:from|import)[ \t]")
+# Imports after a semicolon (``x = 1; import y``); the ambiguity gate
+# above only sees lines that start with the import keyword.
+_COMPOUND_IMPORT_RE = re.compile(rb";[ \t]*(?:from|import)[ \t]")
+
+
+@functools.lru_cache(maxsize=256)
+def _from_parent_pattern(old_parent: str) -> "re.Pattern[bytes]":
+    """Compiled gate matching ``from old_parent import ...`` lines."""
+    return re.compile(
+        rb"^[ \t]*from[ \t]+"
+        + re.escape(old_parent.encode())
+        + rb"[ \t]+import[ \t]",
+        re.M,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _batch_import_pattern(old_modules: Tuple[str, ...]) -> "re.Pattern[bytes]":
+    """Compiled fast-path pattern for plain imports of any listed module.
+
+    The alternation lists the dotted names in spec order, so when one old
+    name is a prefix of another the earlier spec claims the statement —
+    the same first-spec-wins rule the AST rewriter applies.  The matched
+    name is captured (group 1 for ``import``, group 2 for ``from``) so
+    the substitution callback can look up its replacement directly.
+    Cached per name tuple so a rename touching thousands of files
+    compiles its pattern exactly once instead of once per file.
+    """
+    names = b"|".join(re.escape(m.encode()) for m in old_modules)
+    return re.compile(
+        rb"^[ \t]*(?:"
+        rb"import[ \t]+(" + names
+        + rb")(?:\.[\w.]+)?(?:[ \t]+as[ \t]+\w+)?[ \t]*(?:#[^\n]*)?[ \t\r]*"
+        rb"|from[ \t]+(" + names
+        + rb")(?:\.[\w.]+)?[ \t]+import[ \t]+[^\n(\\]+"
+        rb")$",
+        re.M,
+    )
+
+
+def _fast_path_blocked(data: bytes) -> bool:
+    """Return True when ``data`` shows a construct the regex fast path
+    cannot handle faithfully (see :func:`_specialized_rewriter`).
+
+    Fixed-substring guards keep the common path regex-free: each gate
+    pattern only runs when its trigger byte occurs in the file at all.
+    """
+    if b'"""' in data or b"'''" in data:
+        return True
+    if data.startswith(b"\xef\xbb\xbf"):
+        # A UTF-8 BOM sits before line 1's indent, defeating the ^ anchor
+        # for a first-line import; let the AST path handle such files.
+        return True
+    if b"\\\n" in data or b"\\\r" in data:
+        # A backslash before any newline may continue a string literal
+        # onto a line that merely looks like an import statement, so the
+        # ^ anchor cannot be trusted anywhere in the file.
+        return True
+    if (b"(" in data or b"\\" in data or b";" in data) and _AMBIG_IMPORT_RE.search(
+        data
+    ):
+        return True
+    if b"," in data and _MULTI_ALIAS_RE.search(data):
+        return True
+    if _RELATIVE_IMPORT_RE.search(data):
+        return True
+    if b":" in data and _INLINE_IMPORT_RE.search(data):
+        return True
+    if b";" in data and _COMPOUND_IMPORT_RE.search(data):
+        return True
+    return False
+
+
+def _make_batch_replacer(table: Dict[bytes, bytes]):
+    """Bind the substitution callback for a generated fast-path rewriter.
+
+    The pattern captures the old dotted name it matched (group 1 for the
+    ``import`` form, group 2 for ``from``); the replacement is spliced in
+    at exactly that group's span.  Splicing by position rather than
+    searching for the name keeps the surrounding keywords intact even
+    when the old name happens to be a substring of ``import`` or
+    ``from`` itself (single-letter modules, names like ``imp``).
+    """
+    def replace(m: "re.Match[bytes]") -> bytes:
+        group = 1 if m.start(1) != -1 else 2
+        stmt = m.group(0)
+        start = m.start(group) - m.start(0)
+        end = m.end(group) - m.start(0)
+        return stmt[:start] + table[m.group(group)] + stmt[end:]
+
+    return replace
+
+
+@functools.lru_cache(maxsize=64)
+def _specialized_rewriter(
+    specs: Tuple["_RenameSpec", ...]
+) -> Callable[[bytes], Optional[bytes]]:
+    """Generate one single-pass fast-path function for a spec batch.
+
+    For files whose import statements are all plain single-line forms
+    (``import a.b [as c]`` / ``from a.b import names``), an anchored
+    multiline pattern can perform the rewrite without tokenising or
+    parsing anything.  The generated function runs the shared file-level
+    gates once, checks each distinct old parent's ``from parent import``
+    gate (that form needs the rename logic of the AST path — the bound
+    name changes, not just a dotted prefix), then applies one combined
+    substitution over the original bytes.  A single pass with an ordered
+    alternation keeps the semantics identical to the AST rewriter: each
+    statement is claimed by the first spec matching its *original* name,
+    and one rename's output can never feed another's input.  ``None``
+    means the file shows a construct the pattern cannot handle
+    faithfully and the caller must fall back to the AST rewriter.  The
+    result is cached per batch, so the exec cost is paid once per rename
+    set rather than per file.
+    """
+    table: Dict[bytes, bytes] = {}
+    for spec in specs:
+        # First spec wins for duplicated old names, as on the AST path.
+        table.setdefault(spec.old_module.encode(), spec.new_module.encode())
+    namespace: Dict[str, object] = {
+        "_blocked": _fast_path_blocked,
+        "_repl": _make_batch_replacer(table),
+        "_pat": _batch_import_pattern(
+            tuple(name.decode() for name in table)
+        ),
+    }
+    src = [
+        "def rewrite(data):",
+        "    if _blocked(data):",
+        "        return None",
+    ]
+    for i, old_parent in enumerate(
+        dict.fromkeys(spec.old_parent for spec in specs if spec.old_parent)
+    ):
+        namespace[f"_g{i}"] = _from_parent_pattern(old_parent)
+        src.append(f"    if _g{i}.search(data):")
+        src.append("        return None")
+    src.append("    return _pat.sub(_repl, data)")
+    exec(compile("\n".join(src), "<filemover._specialized_rewriter>", "exec"), namespace)
+    return namespace["rewrite"]  # type: ignore[return-value]
+
+
+#: O_CLOEXEC and O_BINARY are platform-specific; degrade to 0 where absent.
+_WRITE_FLAGS = (
+    os.O_WRONLY
+    | os.O_TRUNC
+    | getattr(os, "O_CLOEXEC", 0)
+    | getattr(os, "O_BINARY", 0)
+)
+
+
+def _write_bytes(file_path: Path, data: bytes) -> None:
+    """Write ``data`` over an existing file with a bare open/write/close.
+
+    Path.write_bytes goes through a BufferedWriter; for a one-shot payload
+    that is pure overhead, so truncate and write through the fd directly.
+    The target always exists here (we just read it), hence no O_CREAT.
+    """
+    fd = os.open(file_path, _WRITE_FLAGS)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+#: Thread-local home of the reusable prefilter buffer (see _scan_buffer).
+_scan_local = threading.local()
+
+
+def _scan_buffer() -> bytearray:
+    """Return this thread's reusable prefilter buffer, creating it lazily.
+
+    Reading each candidate file into a preallocated bytearray via
+    ``readinto`` avoids the per-file bytes allocation that ``read_bytes``
+    incurs, which keeps allocator and GC pressure flat across long scans.
+    The buffer is thread-local so concurrent callers never share it.
+    """
+    buf = getattr(_scan_local, "buf", None)
+    if buf is None:
+        buf = bytearray(_SCAN_BUFFER_SIZE)
+        _scan_local.buf = buf
+    return buf
+
+
+def _root_prefix(repo_root: Path) -> str:
+    """Return ``repo_root`` as a string with a trailing separator."""
+    root_str = str(repo_root)
+    return root_str if root_str.endswith(os.sep) else root_str + os.sep
+
+
+def _fast_module_path(root_prefix: str, path_str: str) -> str:
+    """String-slicing counterpart of :func:`compute_module_path`.
+
+    ``root_prefix`` must come from :func:`_root_prefix` and ``path_str``
+    must lie beneath it.  Operating on plain strings avoids the two Path
+    allocations and ``.parts`` traversals that ``Path.relative_to`` costs
+    per call, which adds up in the per-file hot loop.
+    """
+    relative = path_str[len(root_prefix):]
+    for suffix in (".py", ".pyw"):
+        if relative.endswith(suffix):
+            relative = relative[: -len(suffix)]
+            break
+    return relative.replace(os.sep, ".")
+
+
+def _iter_py_files(root: Path) -> Iterator[str]:
+    """Yield the paths of all Python files under ``root`` as strings.
+
+    Uses an iterative :func:`os.scandir` traversal so that the file type
+    cached on each ``DirEntry`` is reused instead of issuing a fresh stat
+    per entry, and prunes the directories in :data:`_SKIP_DIRS` before
+    descending into them.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in _SKIP_DIRS:
+                            stack.append(entry.path)
+                    elif name.endswith((".py", ".pyw")) and entry.is_file():
+                        yield entry.path
+                except OSError:
+                    continue
+
+
+def _index_cache_file() -> str:
+    """Path of the persistent index cache shared by all repositories."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "filemover", "index.json")
+
+
+@dataclass
+class ImportIndex:
+    """Index of which files reference which top-level module names.
+
+    Scanning and parsing every file in a repository is by far the most
+    expensive part of :func:`update_imports`.  For workflows that perform
+    several moves in one process, this index is built once and then used to
+    visit only the files that can possibly import a moved module.
+
+    The index maps the top-level component of each imported dotted name to
+    the set of files containing such an import.  Relative imports are
+    resolved against the importing file's own module path before indexing.
+    The mapping is deliberately kept as a superset after moves: a stale
+    entry merely costs one wasted parse, whereas a missing entry would skip
+    a file that needs rewriting.
+    """
+
+    repo_root: Path
+    by_top: Dict[str, Set[str]] = field(default_factory=dict)
+    #: Per-file cache entries mirroring the on-disk JSON layout:
+    #: relative path -> [mtime_ns, size, sorted top-level names].
+    entries: Dict[str, List[object]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, repo_root: Path) -> "ImportIndex":
+        """Scan ``repo_root`` once and index every import by top-level name."""
+        index = cls(repo_root=repo_root)
+        for path_str in _iter_py_files(repo_root):
+            index._index_file(path_str)
+        return index
+
+    @classmethod
+    def load(cls, repo_root: Path) -> "ImportIndex":
+        """Build an index, reusing the on-disk cache for unchanged files.
+
+        Files whose ``(mtime_ns, size)`` fingerprint matches the cached
+        entry keep their recorded top-level names without being re-read;
+        everything else is (re)parsed as in :meth:`build`.  Call
+        :meth:`save` afterwards so the next invocation benefits from this
+        scan — the typical editor-extension workflow runs one rewrite per
+        rename, and between runs almost every file is unchanged.
+        """
+        import json
+
+        try:
+            with open(_index_cache_file(), "r", encoding="utf-8") as f:
+                cached = json.load(f).get(str(repo_root), {})
+            if not isinstance(cached, dict):
+                cached = {}
+        except (OSError, ValueError):
+            cached = {}
+        index = cls(repo_root=repo_root)
+        root_prefix = _root_prefix(repo_root)
+        for path_str in _iter_py_files(repo_root):
+            try:
+                st = os.stat(path_str)
+            except OSError:
+                continue
+            rel = (
+                path_str[len(root_prefix):]
+                if path_str.startswith(root_prefix)
+                else path_str
+            )
+            entry = cached.get(rel)
+            # Malformed entries (truncated or corrupted cache writes) are
+            # treated as stale rather than allowed to break every later
+            # run: the cache is best-effort state, never load-bearing.
+            if (
+                isinstance(entry, list)
+                and len(entry) == 3
+                and isinstance(entry[2], list)
+                and entry[0] == st.st_mtime_ns
+                and entry[1] == st.st_size
+            ):
+                index.entries[rel] = entry
+                for top in entry[2]:
+                    index.by_top.setdefault(top, set()).add(path_str)
+            else:
+                index._index_file(path_str, stat_result=st)
+        return index
+
+    def save(self) -> None:
+        """Persist the per-file entries for reuse by a later :meth:`load`.
+
+        Best effort: the cache only ever saves work, so I/O failures are
+        swallowed rather than surfaced.  Entries for files rewritten in
+        this run carry their pre-rewrite fingerprint and simply fail
+        validation (and get re-indexed) on the next load.
+        """
+        import json
+
+        cache_file = _index_cache_file()
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                data = {}
+        except (OSError, ValueError):
+            data = {}
+        data[str(self.repo_root)] = self.entries
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            tmp = cache_file + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, cache_file)
+        except OSError:
+            return
+
+    def files_for(self, top_name: str) -> Set[str]:
+        """Return the set of file paths that reference ``top_name``."""
+        return self.by_top.get(top_name, set())
+
+    def record_rewrite(self, path_str: str, new_top: str) -> None:
+        """Record that ``path_str`` now references ``new_top`` after a rewrite."""
+        self.by_top.setdefault(new_top, set()).add(path_str)
+
+    def record_path_move(self, src: Path, dst: Path) -> None:
+        """Remap indexed paths after ``src`` has been moved to ``dst`` on disk."""
+        src_str = str(src)
+        src_prefix = src_str + os.sep
+        for files in self.by_top.values():
+            moved = [p for p in files if p == src_str or p.startswith(src_prefix)]
+            for p in moved:
+                files.discard(p)
+                files.add(str(dst) + p[len(src_str):])
+
+    def _index_file(
+        self, path_str: str, stat_result: Optional[os.stat_result] = None
+    ) -> None:
+        try:
+            if stat_result is None:
+                stat_result = os.stat(path_str)
+            tree = _parse_cached(path_str, stat_result.st_mtime_ns)
+        except (OSError, SyntaxError, ValueError):
+            return
+        tops: Set[str] = set()
+        current_parts: Optional[List[str]] = None
+        for node in _iter_import_nodes(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    tops.add(alias.name.split(".", 1)[0])
+            elif isinstance(node, ast.ImportFrom):
+                if node.level == 0:
+                    if node.module:
+                        tops.add(node.module.split(".", 1)[0])
+                else:
+                    # Resolve the relative import against this file's package
+                    # so the index also finds files importing a moved module
+                    # via ``from . import name``.
+                    if current_parts is None:
+                        root_prefix = _root_prefix(self.repo_root)
+                        if path_str.startswith(root_prefix):
+                            current_parts = _fast_module_path(
+                                root_prefix, path_str
+                            ).split(".")
+                        else:
+                            current_parts = []
+                    package_parts = current_parts[:-1]
+                    trim = node.level - 1
+                    base = package_parts[:-trim] if trim > 0 else package_parts
+                    if base:
+                        tops.add(base[0])
+        for top in tops:
+            self.by_top.setdefault(top, set()).add(path_str)
+        root_prefix = _root_prefix(self.repo_root)
+        rel = (
+            path_str[len(root_prefix):]
+            if path_str.startswith(root_prefix)
+            else path_str
+        )
+        self.entries[rel] = [
+            stat_result.st_mtime_ns,
+            stat_result.st_size,
+            sorted(tops),
+        ]
 
 
-def move_file(src_path: Path, dst_path: Path, repo_root: Path) -> None:
+def move_file(
+    src_path: Path,
+    dst_path: Path,
+    repo_root: Path,
+    index: Optional[ImportIndex] = None,
+) -> None:
     """Move a single Python file to a new location and update imports.
 
     After moving the file, any absolute import statements that referred to
@@ -84,6 +654,9 @@ def move_file(src_path: Path, dst_path: Path, repo_root: Path) -> None:
         should be included.
     repo_root: Path
         Root of the repository for computing module paths.
+    index: ImportIndex, optional
+        A prebuilt :class:`ImportIndex` to restrict the rewrite to files
+        known to import the moved module.  Kept up to date across moves.
 
     Raises
     ------
@@ -109,12 +682,21 @@ def move_file(src_path: Path, dst_path: Path, repo_root: Path) -> None:
     # Ensure destination directory exists
     dst_path.parent.mkdir(parents=True, exist_ok=True)
     # Move the file on disk
-    shutil.move(str(src_path), str(dst_path))
+    _move_path(src_path, dst_path)
+    if index is not None:
+        index.record_path_move(src_path, dst_path)
     # Update imports in all python files under repo_root
-    update_imports(repo_root, old_module, new_module, exclude_paths={dst_path})
+    update_imports(
+        repo_root, old_module, new_module, exclude_paths=[dst_path], index=index
+    )
 
 
-def move_folder(src_dir: Path, dst_dir: Path, repo_root: Path) -> None:
+def move_folder(
+    src_dir: Path,
+    dst_dir: Path,
+    repo_root: Path,
+    index: Optional[ImportIndex] = None,
+) -> None:
     """Move an entire directory tree to a new location and update imports.
 
     This operation moves ``src_dir`` (and everything under it) to ``dst_dir``.
@@ -132,6 +714,9 @@ def move_folder(src_dir: Path, dst_dir: Path, repo_root: Path) -> None:
         directories will be created if necessary.
     repo_root: Path
         Root of the repository for computing module paths.
+    index: ImportIndex, optional
+        A prebuilt :class:`ImportIndex` to restrict the rewrite to files
+        known to import the moved modules.  Kept up to date across moves.
 
     Raises
     ------
@@ -154,9 +739,11 @@ def move_folder(src_dir: Path, dst_dir: Path, repo_root: Path) -> None:
     # Create destination directory if necessary
     dst_dir.parent.mkdir(parents=True, exist_ok=True)
     # Move the directory
-    shutil.move(str(src_dir), str(dst_dir))
+    _move_path(src_dir, dst_dir)
+    if index is not None:
+        index.record_path_move(src_dir, dst_dir)
     # After moving, update imports referencing anything under old_base
-    update_imports(repo_root, old_base, new_base)
+    update_imports(repo_root, old_base, new_base, index=index)
 
 
 def update_imports(
@@ -164,6 +751,7 @@ def update_imports(
     old_module: str,
     new_module: str,
     exclude_paths: Optional[Sequence[Path]] = None,
+    index: Optional[ImportIndex] = None,
 ) -> None:
     """Rewrite import statements that reference one module path with another.
 
@@ -188,26 +776,216 @@ def update_imports(
         when the moved file or directory has already been relocated on
         disk; rewriting it at this point would modify the newly moved
         source unnecessarily.
+    index: ImportIndex, optional
+        A prebuilt :class:`ImportIndex` for ``repo_root``.  When given,
+        only the files known to reference the moved module's top-level
+        name are visited instead of walking the whole repository, and the
+        index is updated in place so it stays usable for further moves.
     """
-    exclude_set = {p.resolve() for p in (exclude_paths or [])}
-    # Normalise modules for prefix matching
-    old_prefix = old_module + "."
-    new_prefix = new_module + "."
-    for root, _, files in os.walk(repo_root):
-        for filename in files:
-            if not filename.endswith((".py", ".pyw")):
-                continue
-            file_path = Path(root) / filename
-            if file_path.resolve() in exclude_set:
-                continue
-            update_file_imports(
-                file_path,
-                old_module,
-                new_module,
-                repo_root=repo_root,
-                old_prefix=old_prefix,
-                new_prefix=new_prefix,
-            )
+    # Normalised string paths avoid a per-file Path.resolve() (and its
+    # realpath syscalls) when testing membership during the walk.
+    if old_module == new_module:
+        # A no-op rename would still walk and read the whole repository.
+        return
+    exclude_set = {os.path.normpath(str(p)) for p in (exclude_paths or [])}
+    spec = _RenameSpec.create(old_module, new_module)
+    new_top = spec.new_module.split(".", 1)[0]
+    if index is not None:
+        # Visit only the files known to reference the moved module's
+        # top-level name instead of re-walking the whole repository.
+        candidates: Iterator[str] = iter(sorted(index.files_for(spec.old_top)))
+    else:
+        candidates = _iter_py_files(repo_root)
+    # The walk already yields absolute paths, so membership is a plain
+    # string comparison; when nothing is excluded (the move_folder case)
+    # skip even the per-file normpath call.
+    if exclude_set:
+        paths = [p for p in candidates if os.path.normpath(p) not in exclude_set]
+    else:
+        paths = list(candidates)
+    _rewrite_paths(paths, (spec,), repo_root)
+    if index is not None:
+        for path_str in paths:
+            index.record_rewrite(path_str, new_top)
+
+
+def _rewrite_paths(
+    paths: List[str], specs: Tuple[_RenameSpec, ...], repo_root: Path
+) -> None:
+    """Rewrite every file in ``paths``, in parallel for large batches.
+
+    The per-file work (read, parse, rewrite, write) is independent across
+    files and dominated by ast.parse, so batches of at least
+    _PARALLEL_THRESHOLD files are farmed out to worker processes; smaller
+    batches stay serial to avoid pool startup cost.  concurrent.futures
+    is imported lazily: it is only needed on the parallel branch and its
+    import is not free.
+    """
+    if len(paths) >= _PARALLEL_THRESHOLD:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Prefer fork on POSIX so workers inherit the already-imported
+        # interpreter state instead of re-importing this module per spawn;
+        # the initializer binds the rename specs once per worker so each
+        # task only ships a path string.
+        try:
+            mp_context = multiprocessing.get_context("fork")
+        except ValueError:
+            mp_context = multiprocessing.get_context()
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=mp_context,
+            initializer=_pool_init,
+            initargs=(specs, str(repo_root)),
+        ) as executor:
+            list(executor.map(_rewrite_one, paths, chunksize=32))
+    else:
+        for path_str in paths:
+            _rewrite_file(Path(path_str), specs, repo_root=repo_root)
+
+
+def update_imports_many(
+    repo_root: Path,
+    renames: Sequence[Tuple[str, str]],
+    exclude_paths: Optional[Sequence[Path]] = None,
+    index: Optional[ImportIndex] = None,
+) -> None:
+    """Rewrite imports for several module renames in one repository pass.
+
+    Equivalent to calling :func:`update_imports` once per ``(old_module,
+    new_module)`` pair, but the repository tree is walked once and each
+    candidate file is read, parsed and written back at most once with
+    every rename applied, so the cost of a multi-move refactor no longer
+    scales with the number of renames.
+
+    Parameters
+    ----------
+    repo_root: Path
+        The root directory of the repository.
+    renames: Sequence[Tuple[str, str]]
+        ``(old_module, new_module)`` pairs of fully qualified dotted
+        names.  When pairs have overlapping dotted prefixes, order them
+        longest old name first so nested renames apply before their
+        parents.
+    exclude_paths: Sequence[Path], optional
+        File paths to skip when rewriting imports, as for
+        :func:`update_imports`.
+    index: ImportIndex, optional
+        A prebuilt :class:`ImportIndex` for ``repo_root``, as for
+        :func:`update_imports`; only files referencing some renamed
+        module's top-level name are visited.
+    """
+    specs = tuple(
+        _RenameSpec.create(old_module, new_module)
+        for old_module, new_module in renames
+        if old_module != new_module
+    )
+    if not specs:
+        return
+    exclude_set = {os.path.normpath(str(p)) for p in (exclude_paths or [])}
+    if index is not None:
+        files: Set[str] = set()
+        for spec in specs:
+            files |= index.files_for(spec.old_top)
+        candidates: Iterator[str] = iter(sorted(files))
+    else:
+        candidates = _iter_py_files(repo_root)
+    if exclude_set:
+        paths = [p for p in candidates if os.path.normpath(p) not in exclude_set]
+    else:
+        paths = list(candidates)
+    _rewrite_paths(paths, specs, repo_root)
+    if index is not None:
+        for spec in specs:
+            new_top = spec.new_module.split(".", 1)[0]
+            for path_str in paths:
+                index.record_rewrite(path_str, new_top)
+
+
+def _move_path(src: Path, dst: Path) -> None:
+    """Move ``src`` to ``dst``, preferring a single rename syscall.
+
+    In the common case src and dst live on the same filesystem, so a plain
+    :func:`os.replace` suffices and avoids the stat inspection (and
+    potential copy-and-unlink fallback) that :func:`shutil.move` performs.
+    Only a cross-device move (``EXDEV``) falls back to shutil, which is
+    imported lazily to keep module import light.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        import shutil
+
+        shutil.move(str(src), str(dst))
+
+
+@dataclass(frozen=True)
+class _RenameSpec:
+    """Precomputed matching context for one ``(old_module, new_module)`` pair.
+
+    All the derived strings the per-node rewrite loop needs — dotted
+    prefixes, parent and base names, the top-level component and the byte
+    needles for the prefilter — are computed once here instead of once per
+    visited file (or worse, per node).
+    """
+
+    old_module: str
+    new_module: str
+    prefix: str
+    new_prefix: str
+    prefix_len: int
+    old_parent: str
+    old_name: str
+    new_parent: str
+    new_name: str
+    old_top: str
+    needle: bytes
+    rel_needle: bytes
+
+    @classmethod
+    def create(cls, old_module: str, new_module: str) -> "_RenameSpec":
+        old_parts = old_module.split(".")
+        new_parts = new_module.split(".")
+        prefix = old_module + "."
+        return cls(
+            old_module=old_module,
+            new_module=new_module,
+            prefix=prefix,
+            new_prefix=new_module + ".",
+            prefix_len=len(prefix),
+            old_parent=".".join(old_parts[:-1]),
+            old_name=old_parts[-1],
+            new_parent=".".join(new_parts[:-1]),
+            new_name=new_parts[-1],
+            old_top=old_parts[0],
+            needle=old_parts[0].encode(),
+            rel_needle=old_parts[-1].encode(),
+        )
+
+
+#: Per-worker state set by _pool_init: (specs, repo_root).
+_worker_args: Optional[Tuple[Tuple[_RenameSpec, ...], Path]] = None
+
+
+def _pool_init(specs: Tuple[_RenameSpec, ...], repo_root_str: str) -> None:
+    """Bind the rename specs once in each pool worker.
+
+    Runs as the ``ProcessPoolExecutor`` initializer so that individual
+    tasks only need to carry a path string instead of repeating the same
+    rename specs and repository root in every pickled work item.
+    """
+    global _worker_args
+    _worker_args = (specs, Path(repo_root_str))
+
+
+def _rewrite_one(path_str: str) -> None:
+    """Rewrite imports in one file; picklable worker for the process pool."""
+    assert _worker_args is not None, "_pool_init must run before _rewrite_one"
+    specs, repo_root = _worker_args
+    _rewrite_file(Path(path_str), specs, repo_root=repo_root)
 
 
 def update_file_imports(
@@ -216,19 +994,18 @@ def update_file_imports(
     new_module: str,
     *,
     repo_root: Optional[Path] = None,
-    old_prefix: Optional[str] = None,
-    new_prefix: Optional[str] = None,
 ) -> None:
     """Update import statements in a single Python file.
 
     Reads ``file_path``, parses it into an AST, and rewrites any import
     statements that reference ``old_module`` to instead reference
     ``new_module``.  The function will write the modified source back to
-    disk only if at least one import has been changed.
+    disk only if at least one import has been changed.  Bytes outside the
+    rewritten statements — including the file's original line endings —
+    are never touched or re-encoded.
 
-    This helper is internal to the module and expects ``old_prefix`` and
-    ``new_prefix`` when called from :func:`update_imports` to avoid
-    recomputing them repeatedly.
+    This is a convenience wrapper around the multi-rename core used by
+    :func:`update_imports` and :func:`update_imports_many`.
 
     Parameters
     ----------
@@ -238,128 +1015,222 @@ def update_file_imports(
         The dotted name of the module or package being replaced.
     new_module: str
         The dotted name of the replacement module or package.
-    old_prefix: str, optional
-        The ``old_module`` plus a trailing dot.  Precomputed for
-        efficiency.
-    new_prefix: str, optional
-        The ``new_module`` plus a trailing dot.  Precomputed for
-        efficiency.
+    repo_root: Path, optional
+        Root of the repository; required for resolving relative imports.
+    """
+    _rewrite_file(
+        file_path, (_RenameSpec.create(old_module, new_module),), repo_root=repo_root
+    )
+
+
+def _rewrite_file(
+    file_path: Path,
+    specs: Sequence[_RenameSpec],
+    repo_root: Optional[Path] = None,
+) -> None:
+    """Apply every rename in ``specs`` to one file in a single pass.
+
+    The file is read once, the prefilter and (if possible) the regex fast
+    path run once per spec against the same buffer, and at most one parse
+    and one write happen regardless of how many renames are in flight.
+    Where several specs could touch the same statement, each alias is
+    rewritten by the first spec that matches it; callers with overlapping
+    dotted prefixes should order ``specs`` longest-old-name first.
     """
-    source = file_path.read_text(encoding="utf-8")
+    # Fast rejection, cheapest test first: every import statement contains
+    # the token ``import``, so files without it (generated data, fixtures)
+    # need no parse at all.  Beyond that, an absolute import of a moved
+    # module must mention its top-level component, and a relative import
+    # that resolves to it must mention its final component.  Bounded
+    # find() calls run CPython's C substring search directly against the
+    # reusable scan buffer, so only the handful of files that can match
+    # ever pay for a parse.
+    def passes_prefilter(buf, end: int) -> bool:
+        if buf.find(b"import", 0, end) < 0:
+            return False
+        for spec in specs:
+            if (
+                buf.find(spec.needle, 0, end) >= 0
+                or buf.find(spec.rel_needle, 0, end) >= 0
+            ):
+                return True
+        return False
+
+    # Scan via readinto() on this thread's preallocated buffer: rejected
+    # files — the overwhelming majority — cost no bytes allocation at all.
+    # Files too big for the buffer are decided on the head where possible
+    # (imports cluster at the top); when the head says nothing, the tail is
+    # scanned through a read-only mmap so a rejection never copies the file
+    # into a Python bytes object — find() runs straight over the page cache.
+    buf = _scan_buffer()
+    with open(file_path, "rb") as f:
+        read = f.readinto(buf)
+        if read < len(buf):
+            if not passes_prefilter(buf, read):
+                return
+            data = bytes(memoryview(buf)[:read])
+        elif passes_prefilter(buf, read):
+            data = bytes(buf) + f.read()
+        else:
+            import mmap
+
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # mmap can fail on exotic filesystems; fall back to reading.
+                data = bytes(buf) + f.read()
+                if not passes_prefilter(data, len(data)):
+                    return
+            else:
+                with mm:
+                    if not passes_prefilter(mm, len(mm)):
+                        return
+                    data = bytes(mm)
+    # Regex fast path: files containing only plain single-line imports are
+    # rewritten without parsing at all, through a function generated once
+    # per spec batch with every rename's substitution inlined; anything
+    # ambiguous falls through to the exact AST rewriter below.
+    rewritten = _specialized_rewriter(tuple(specs))(data)
+    if rewritten is not None:
+        # Write back only on a real change: an untouched file must not get
+        # its mtime bumped or trigger VCS/watcher churn.  The identity test
+        # first makes the no-match case free (re.sub returns the original
+        # object when nothing matched).
+        if rewritten is not data and rewritten != data:
+            _write_bytes(file_path, rewritten)
+        return
     try:
-        tree = ast.parse(source)
-    except SyntaxError:
+        tree = _parse_cached(str(file_path), file_path.stat().st_mtime_ns)
+    except (OSError, SyntaxError, ValueError):
         # Skip files with syntax errors (e.g. if they contain Python >=3.10 features)
         return
-    modifications: List[Tuple[int, int, str]] = []  # (start_line, end_line, replacement)
-    prefix = old_prefix if old_prefix is not None else old_module + "."
-    newpref = new_prefix if new_prefix is not None else new_module + "."
-    old_parts = old_module.split('.')
-    new_parts = new_module.split('.')
-    # Determine parent and base names for old and new modules for from‑import rewriting
-    old_parent = '.'.join(old_parts[:-1]) if len(old_parts) > 1 else ''
-    old_name = old_parts[-1]
-    new_parent = '.'.join(new_parts[:-1]) if len(new_parts) > 1 else ''
-    new_name = new_parts[-1]
+    modifications: List[Tuple[ast.stmt, str]] = []  # (import node, replacement code)
 
     # Compute current module path for relative import resolution
     current_module_path: Optional[str] = None
     if repo_root is not None:
-        try:
-            current_module_path = compute_module_path(repo_root, file_path)
-        except Exception:
-            current_module_path = None
-
-    # Helper to convert an alias into a string representation for import statements.
-    # If an alias has an ``asname`` that differs from its ``name``, use the
-    # ``name as asname`` form.  Otherwise return the name alone.  This avoids
-    # producing redundant ``as name`` when the alias does not actually rename
-    # the import.
-    def alias_to_str(a: ast.alias) -> str:
-        if a.asname and a.asname != a.name:
-            return f"{a.name} as {a.asname}"
-        return a.name
-
-    for node in ast.walk(tree):
-        # Skip nodes that are not import statements
+        root_prefix = _root_prefix(repo_root)
+        path_str = str(file_path)
+        if path_str.startswith(root_prefix):
+            current_module_path = _fast_module_path(root_prefix, path_str)
+
+    # Helper to render a ``(name, asname)`` pair as import statement text.
+    # If ``asname`` is set and differs from ``name``, use the ``name as
+    # asname`` form.  Otherwise return the name alone.  This avoids
+    # producing redundant ``as name`` when the alias does not actually
+    # rename the import.  Plain tuples are carried through the loop instead
+    # of ast.alias nodes: the values are only ever formatted into strings,
+    # so building AST objects would be pointless allocation churn.
+    def alias_to_str(a: Tuple[str, Optional[str]]) -> str:
+        name, asname = a
+        if asname and asname != name:
+            return f"{name} as {asname}"
+        return name
+
+    for node in _iter_import_nodes(tree):
         if isinstance(node, ast.Import):
             replaced_any = False
-            new_aliases: List[ast.alias] = []
+            new_aliases: List[Tuple[str, Optional[str]]] = []
             for alias in node.names:
                 name = alias.name
-                if name == old_module or name.startswith(prefix):
-                    # Compute new name by swapping prefix
-                    if name == old_module:
-                        new_name_for_alias = new_module
-                    else:
-                        new_name_for_alias = newpref + name[len(prefix):]
-                    new_aliases.append(ast.alias(name=new_name_for_alias, asname=alias.asname))
-                    replaced_any = True
+                # The first spec matching this alias wins
+                for spec in specs:
+                    if name == spec.old_module:
+                        new_aliases.append((spec.new_module, alias.asname))
+                        replaced_any = True
+                        break
+                    if name.startswith(spec.prefix):
+                        new_aliases.append(
+                            (spec.new_prefix + name[spec.prefix_len:], alias.asname)
+                        )
+                        replaced_any = True
+                        break
                 else:
-                    new_aliases.append(alias)
+                    new_aliases.append((name, alias.asname))
             if replaced_any:
                 # Build replacement code for the entire import statement
                 parts = [alias_to_str(a) for a in new_aliases]
                 new_code = f"import {', '.join(parts)}"
-                # Preserve indentation for import statements that appear inside indented blocks
-                indent = ' ' * getattr(node, 'col_offset', 0)
-                modifications.append((node.lineno, getattr(node, 'end_lineno', node.lineno), indent + new_code))
+                modifications.append((node, new_code))
         elif isinstance(node, ast.ImportFrom):
             module = node.module or ''
             # Two cases: absolute import (level == 0) or relative import (level > 0)
             if node.level == 0:
-                # Absolute import
-                # Scenario 1: from old_module[...] import something -> update module prefix
-                if module == old_module or module.startswith(prefix):
-                    # Replace old_module prefix with new_module
-                    if module == old_module:
-                        new_module_name = new_module
-                    else:
-                        new_module_name = newpref + module[len(prefix):]
-                    new_names = node.names  # Keep names the same
-                    # Build replacement code
-                    parts_list = [alias_to_str(a) for a in new_names]
-                    new_code = f"from {new_module_name} import {', '.join(parts_list)}"
-                    # Preserve indentation for import statements that appear inside indented blocks
-                    indent = ' ' * getattr(node, 'col_offset', 0)
-                    modifications.append((node.lineno, getattr(node, 'end_lineno', node.lineno), indent + new_code))
+                # Scenario 1: from old_module[...] import something -> update module prefix.
+                # Every form rewritten here starts with a spec's old top-level
+                # name, so one comparison dismisses unrelated specs up front.
+                handled = False
+                for spec in specs:
+                    if not module.startswith(spec.old_top):
+                        continue
+                    if module == spec.old_module or module.startswith(spec.prefix):
+                        # Replace the old module prefix with the new one
+                        if module == spec.old_module:
+                            new_module_name = spec.new_module
+                        else:
+                            new_module_name = spec.new_prefix + module[spec.prefix_len:]
+                        # Keep the imported names the same
+                        parts_list = [
+                            alias_to_str((a.name, a.asname)) for a in node.names
+                        ]
+                        new_code = (
+                            f"from {new_module_name} import {', '.join(parts_list)}"
+                        )
+                        modifications.append((node, new_code))
+                        handled = True
+                        break
+                if handled:
                     continue
-                # Scenario 2: from old_parent import old_name -> from new_parent import new_name
-                if module == old_parent:
-                    # Rename aliases matching old_name
-                    replaced_any = False
-                    new_aliases: List[ast.alias] = []
-                    for alias in node.names:
-                        if alias.name == old_name:
+                # Scenario 2: from old_parent import old_name -> from new_parent import new_name.
+                # The first spec whose parent matches fixes the target parent;
+                # further specs with the same old and new parent (the
+                # folder-move case) are folded into the same statement.
+                chosen = None
+                for spec in specs:
+                    if spec.old_parent and module == spec.old_parent:
+                        chosen = spec
+                        break
+                if chosen is None:
+                    continue
+                group = [
+                    s
+                    for s in specs
+                    if s.old_parent == module and s.new_parent == chosen.new_parent
+                ]
+                replaced_any = False
+                new_aliases: List[Tuple[str, Optional[str]]] = []
+                for alias in node.names:
+                    for spec in group:
+                        if alias.name == spec.old_name:
                             # Preserve the original local name using alias.asname or alias.name
                             local_name = alias.asname or alias.name
-                            new_aliases.append(ast.alias(name=new_name, asname=local_name))
+                            new_aliases.append((spec.new_name, local_name))
                             replaced_any = True
-                        else:
-                            new_aliases.append(alias)
-                    if replaced_any:
-                        # If the new module has a parent, we can construct a from-import statement.
-                        if new_parent:
-                            parts_list = [alias_to_str(a) for a in new_aliases]
-                            new_code = f"from {new_parent} import {', '.join(parts_list)}"
-                            # Preserve indentation for import statements that appear inside indented blocks
-                            indent = ' ' * getattr(node, 'col_offset', 0)
-                            modifications.append((node.lineno, getattr(node, 'end_lineno', node.lineno), indent + new_code))
-                        else:
-                            # new_module is top-level.  We only support rewriting when a single name is imported.
-                            # Otherwise we risk generating invalid code for other names.
-                            if len(node.names) == 1:
-                                alias_obj = new_aliases[0]
-                                # alias_obj.name is new_name; alias_obj.asname is local name
-                                local_name = alias_obj.asname or alias_obj.name
-                                if local_name != alias_obj.name:
-                                    new_code = f"import {alias_obj.name} as {local_name}"
-                                else:
-                                    new_code = f"import {alias_obj.name}"
-                                # Preserve indentation for import statements that appear inside indented blocks
-                                indent = ' ' * getattr(node, 'col_offset', 0)
-                                modifications.append((node.lineno, getattr(node, 'end_lineno', node.lineno), indent + new_code))
-                            # For multiple names when new_module is top-level, skip rewriting.
+                            break
+                    else:
+                        new_aliases.append((alias.name, alias.asname))
+                if replaced_any:
+                    # If the new module has a parent, we can construct a from-import statement.
+                    if chosen.new_parent:
+                        parts_list = [alias_to_str(a) for a in new_aliases]
+                        new_code = (
+                            f"from {chosen.new_parent} import {', '.join(parts_list)}"
+                        )
+                        modifications.append((node, new_code))
+                    else:
+                        # The new module is top-level.  We only support rewriting
+                        # when a single name is imported; otherwise we risk
+                        # generating invalid code for other names.
+                        if len(node.names) == 1:
+                            # First element is the new name; second is the local name
+                            alias_name, alias_asname = new_aliases[0]
+                            local_name = alias_asname or alias_name
+                            if local_name != alias_name:
+                                new_code = f"import {alias_name} as {local_name}"
+                            else:
+                                new_code = f"import {alias_name}"
+                            modifications.append((node, new_code))
+                        # For multiple names when the new module is top-level, skip rewriting.
             else:
                 # Relative import. We compute the absolute module of the imported names
                 # Only proceed if repo_root and current_module_path are available
@@ -386,71 +1257,102 @@ def update_file_imports(
                 module_parts = (node.module.split('.') if node.module else [])
                 base_parts = ascend_parts + module_parts
                 actual_module = '.'.join(base_parts)
-                # Track if modifications should occur
-                replaced_any = False
-                new_aliases: List[ast.alias] = []
-                for alias in node.names:
+
+                def matching_spec(alias, candidates):
                     alias_full_parts = base_parts + alias.name.split('.')
                     alias_full = '.'.join(alias_full_parts)
-                    if alias_full == old_module or (
-                        alias.name == old_name and actual_module == old_parent
-                    ):
-                        # Replace alias with new_name, preserving original local name via 'as'
+                    for spec in candidates:
+                        if alias_full == spec.old_module or (
+                            alias.name == spec.old_name
+                            and actual_module == spec.old_parent
+                        ):
+                            return spec
+                    return None
+
+                # As in scenario 2 above, the first matching spec fixes the
+                # statement's target parents and compatible specs are folded in.
+                chosen = None
+                for alias in node.names:
+                    chosen = matching_spec(alias, specs)
+                    if chosen is not None:
+                        break
+                if chosen is None:
+                    continue
+                group = [
+                    s
+                    for s in specs
+                    if s.old_parent == chosen.old_parent
+                    and s.new_parent == chosen.new_parent
+                ]
+                replaced_any = False
+                new_aliases: List[Tuple[str, Optional[str]]] = []
+                for alias in node.names:
+                    spec = matching_spec(alias, group)
+                    if spec is not None:
+                        # Replace the alias, preserving the original local name via 'as'
                         local_name = alias.asname or alias.name
-                        new_aliases.append(ast.alias(name=new_name, asname=local_name))
+                        new_aliases.append((spec.new_name, local_name))
                         replaced_any = True
                     else:
-                        new_aliases.append(alias)
+                        new_aliases.append((alias.name, alias.asname))
                 if replaced_any:
                     # Build new import statement.  If the moved module remains in the same package
                     # (i.e., new_parent == old_parent), we preserve the relative import syntax.
                     # Determine the replacement code string based on the new parent.
-                    if new_parent == old_parent:
+                    if chosen.new_parent == chosen.old_parent:
                         # Keep the original relative import level and module
                         module_str = node.module or ''
                         dot_prefix = '.' * node.level
                         parts_list = [alias_to_str(a) for a in new_aliases]
                         new_code = f"from {dot_prefix}{module_str} import {', '.join(parts_list)}"
                     else:
-                        if new_parent:
+                        if chosen.new_parent:
                             parts_list = [alias_to_str(a) for a in new_aliases]
-                            new_code = f"from {new_parent} import {', '.join(parts_list)}"
+                            new_code = f"from {chosen.new_parent} import {', '.join(parts_list)}"
                         else:
                             # new module at top level: only rewrite when one alias exists
                             if len(node.names) == 1:
-                                alias_obj = new_aliases[0]
-                                local_name = alias_obj.asname or alias_obj.name
-                                if local_name != alias_obj.name:
-                                    new_code = f"import {alias_obj.name} as {local_name}"
+                                alias_name, alias_asname = new_aliases[0]
+                                local_name = alias_asname or alias_name
+                                if local_name != alias_name:
+                                    new_code = f"import {alias_name} as {local_name}"
                                 else:
-                                    new_code = f"import {alias_obj.name}"
+                                    new_code = f"import {alias_name}"
                             else:
                                 new_code = None
                     if new_code:
-                        # Preserve indentation for import statements that appear inside indented blocks
-                        indent = ' ' * getattr(node, 'col_offset', 0)
-                        modifications.append((node.lineno, getattr(node, 'end_lineno', node.lineno), indent + new_code))
+                        modifications.append((node, new_code))
     # If no modifications, return early
     if not modifications:
         return
-    # Sort modifications by starting line
-    modifications.sort(key=lambda x: x[0])
-    # Apply modifications to the source lines
-    lines = source.splitlines()
-    new_lines: List[str] = []
-    current_line = 1
-    idx = 0
-    while current_line <= len(lines):
-        if idx < len(modifications) and current_line == modifications[idx][0]:
-            # Write new import code; ensure it ends with newline
-            start_line, end_line, replacement = modifications[idx]
-            new_lines.append(replacement)
-            current_line = end_line + 1
-            idx += 1
-        else:
-            new_lines.append(lines[current_line - 1])
-            current_line += 1
-    # Write back if changed
-    new_source = "\n".join(new_lines)
-    if new_source != source:
-        file_path.write_text(new_source, encoding="utf-8")
\ No newline at end of file
+    # Splice the replacements directly into the raw bytes.  AST column
+    # offsets are UTF-8 byte offsets, so a line-start offset table maps each
+    # node to a byte range.  Replacing only those ranges (in descending
+    # order, so earlier offsets stay valid) leaves every untouched byte of
+    # the file verbatim — indentation, trailing comments and line endings
+    # included — and avoids the splitlines/join round-trip entirely.
+    offsets = [0]
+    for line in data.splitlines(keepends=True):
+        offsets.append(offsets[-1] + len(line))
+    if data.startswith(b"\xef\xbb\xbf"):
+        # compile() strips a UTF-8 BOM before assigning col_offsets, so
+        # line-1 columns are relative to the byte after it; later lines
+        # already include it through line 1's length.
+        offsets[0] = 3
+    spans = sorted(
+        (
+            (
+                offsets[node.lineno - 1] + node.col_offset,
+                offsets[node.end_lineno - 1] + node.end_col_offset,
+                replacement,
+            )
+            for node, replacement in modifications
+        ),
+        reverse=True,
+    )
+    out = bytearray(data)
+    for start, end, replacement in spans:
+        out[start:end] = replacement.encode("utf-8")
+    new_data = bytes(out)
+    if new_data != data:
+        _write_bytes(file_path, new_data)
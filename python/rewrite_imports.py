@@ -1,17 +1,31 @@
 #!/usr/bin/env python
-import json
 import os
 import sys
 from pathlib import Path
 
+try:
+    # orjson parses large payloads several times faster than the stdlib;
+    # both accept str input, so the fallback is a drop-in.
+    import orjson as json
+except ImportError:
+    import json  # type: ignore[no-redef]
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: rewrite_imports.py '{\"repo_root\": \"/path\", \"renames\": [{\"oldUri\": \"/old\", \"newUri\": \"/new\"}]}'", file=sys.stderr)
+        print("       rewrite_imports.py -   (read the JSON payload from stdin)", file=sys.stderr)
         sys.exit(2)
 
     try:
-        payload = json.loads(sys.argv[1])
-        repo_root = Path(payload["repo_root"]).resolve()
+        if sys.argv[1] == "-":
+            # Large refactors can exceed argv limits; reading the payload
+            # from stdin as bytes also lets the parser skip a decode pass.
+            payload = json.loads(sys.stdin.buffer.read())
+        else:
+            payload = json.loads(sys.argv[1])
+        # One realpath call up front; everything below works on plain
+        # strings so long rename lists allocate no per-item Path objects.
+        repo_root_str = os.path.realpath(payload["repo_root"])
         renames = payload["renames"]
     except Exception as e:
         print(f"Invalid payload: {e}", file=sys.stderr)
@@ -19,23 +33,44 @@ def main():
 
     try:
         # Import here so extension fails gracefully if user hasn't installed filemover yet
-        from filemover.mover import compute_module_path, update_imports
+        from filemover.mover import ImportIndex, compute_module_path, update_imports_many
     except Exception as e:
         print("Could not import 'filemover'. Make sure it is installed in the selected Python environment. E.g. via command 'pip install git+https://github.com/plex1/filemover'", file=sys.stderr)
         print(str(e), file=sys.stderr)
         sys.exit(3)
 
-    # For each rename, compute dotted module names from old/new paths and update imports once.
-    for item in renames:
-        old_path = Path(item["oldUri"])
-        new_path = Path(item["newUri"])
+    # Compute dotted module names from old/new paths up front, then rewrite
+    # all renames in a single pass over the repository instead of walking
+    # and parsing every file once per rename.
+    # We rely on dotted-name computation only; existence not required
+    # Deduplicate, then order longest old name first so that when a package
+    # move and moves of its submodules arrive in one batch, the more
+    # specific rename claims an import before the parent prefix swap does.
+    pairs = {
+        (
+            compute_module_path(repo_root_str, item["oldUri"]),
+            compute_module_path(repo_root_str, item["newUri"]),
+        )
+        for item in renames
+    }
+    # Drop no-op pairs (case-only moves on case-insensitive filesystems,
+    # spurious editor events) before paying for any repository scan.
+    mapping = sorted(
+        (p for p in pairs if p[0] and p[1] and p[0] != p[1]),
+        key=lambda p: -len(p[0]),
+    )
+    if not mapping:
+        sys.exit(0)
 
-        # We rely on dotted-name computation only; existence not required
-        old_module = compute_module_path(repo_root, old_path)
-        new_module = compute_module_path(repo_root, new_path)
+    repo_root = Path(repo_root_str)
 
-        # Rewrite absolute imports throughout the repo
-        update_imports(repo_root, old_module, new_module)
+    # Rewrite absolute imports throughout the repo.  The persistent index
+    # makes repeated invocations (one per rename fired by the editor) cheap:
+    # files unchanged since the previous run are filtered by their cached
+    # mtime/size fingerprint instead of being re-read.
+    index = ImportIndex.load(repo_root)
+    update_imports_many(repo_root, mapping, index=index)
+    index.save()
 
     sys.exit(0)
 
@@ -30,7 +30,9 @@ function runPythonHelper(
             renames
         });
 
-        const args = [...extraArgs, helperPath, payload];
+        // "-" tells the helper to read the payload from stdin, so large
+        // rename batches never hit OS argv-length limits.
+        const args = [...extraArgs, helperPath, "-"];
 
         log(
             `Spawning Python helper.\n  pythonPath: ${pythonPath}\n  helperPath: ${helperPath}\n  repoRoot:   ${repoRoot}\n  renames:    ${renames.length}`
@@ -47,6 +49,12 @@ function runPythonHelper(
         proc.stdout.on("data", (d) => (stdout += d.toString()));
         proc.stderr.on("data", (d) => (stderr += d.toString()));
 
+        // An early process exit can surface as EPIPE on stdin; the close
+        // handler below already reports the real failure.
+        proc.stdin.on("error", (err) => log(`Python stdin error: ${err.message}`));
+        proc.stdin.write(payload);
+        proc.stdin.end();
+
         proc.on("error", (err) => {
             log(`Python process error: ${err.message}`);
             reject(err);
@@ -0,0 +1,235 @@
+"""Unit tests for :mod:`filemover.mover`.
+
+Focused on the pathological inputs that the regex fast path must either
+rewrite exactly or hand over to the AST rewriter: trailing comments,
+triple-quoted and backslash-continued strings, BOM-prefixed files,
+function-scoped imports, CRLF line endings and overlapping rename
+batches.  Run with ``python -m unittest discover -s tests``.
+"""
+
+import ast
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from filemover.mover import (
+    ImportIndex,
+    _index_cache_file,
+    _RenameSpec,
+    _rewrite_file,
+    update_file_imports,
+    update_imports,
+    update_imports_many,
+)
+
+
+class RewriteFileBase(unittest.TestCase):
+    """Shared scratch repository for per-file rewrite tests."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+
+    def rewrite(self, content: bytes, renames, name: str = "t.py") -> bytes:
+        path = self.root / name
+        path.write_bytes(content)
+        specs = tuple(_RenameSpec.create(old, new) for old, new in renames)
+        _rewrite_file(path, specs, repo_root=self.root)
+        return path.read_bytes()
+
+
+class TestFastPathEdgeCases(RewriteFileBase):
+    def test_plain_import_with_trailing_comment(self):
+        got = self.rewrite(
+            b"import pkg.mod  # used for X\n"
+            b"from pkg.mod import X  # also\n"
+            b"import os  # keep\n",
+            [("pkg.mod", "new.mod")],
+        )
+        self.assertEqual(
+            got,
+            b"import new.mod  # used for X\n"
+            b"from new.mod import X  # also\n"
+            b"import os  # keep\n",
+        )
+
+    def test_comment_with_gate_bytes_falls_back_to_ast(self):
+        got = self.rewrite(
+            b"import pkg.mod  # see foo(bar)\n", [("pkg.mod", "new.mod")]
+        )
+        self.assertIn(b"import new.mod", got)
+
+    def test_backslash_continued_string_is_not_rewritten(self):
+        content = b's = "foo \\\nfrom pkg.mod import X"\nimport os\n'
+        got = self.rewrite(content, [("pkg.mod", "new.mod")])
+        self.assertEqual(got, content)
+
+    def test_triple_quoted_import_text_is_not_rewritten(self):
+        content = b'doc = """\nimport pkg.mod\n"""\n'
+        got = self.rewrite(content, [("pkg.mod", "new.mod")])
+        self.assertEqual(got, content)
+
+    def test_bom_file_with_line_one_import(self):
+        got = self.rewrite(
+            b"\xef\xbb\xbfimport pkg.mod\n", [("pkg.mod", "new.mod")]
+        )
+        self.assertEqual(got, b"\xef\xbb\xbfimport new.mod\n")
+
+    def test_bom_file_through_ast_path(self):
+        got = self.rewrite(
+            b'\xef\xbb\xbfimport pkg.mod\n"""doc"""\nfrom pkg.mod import X\n',
+            [("pkg.mod", "new.mod")],
+        )
+        self.assertEqual(
+            got, b'\xef\xbb\xbfimport new.mod\n"""doc"""\nfrom new.mod import X\n'
+        )
+
+    def test_compound_statement_import_both_routes(self):
+        got = self.rewrite(b"x = 1; import pkg.mod\n", [("pkg.mod", "new.mod")])
+        self.assertEqual(got, b"x = 1; import new.mod\n")
+        got = self.rewrite(
+            b'"""d"""\nx = 1; import pkg.mod\n', [("pkg.mod", "new.mod")]
+        )
+        self.assertEqual(got, b'"""d"""\nx = 1; import new.mod\n')
+
+    def test_crlf_line_endings_preserved(self):
+        got = self.rewrite(
+            b"import pkg.mod  # c\r\nimport os\r\n", [("pkg.mod", "new.mod")]
+        )
+        self.assertEqual(got, b"import new.mod  # c\r\nimport os\r\n")
+
+
+class TestAstPathParity(RewriteFileBase):
+    def test_function_scoped_import_with_docstring(self):
+        got = self.rewrite(
+            b'"""doc"""\n\n\ndef f():\n    import pkg.mod\n    return pkg.mod\n',
+            [("pkg.mod", "new.mod")],
+        )
+        self.assertIn(b"    import new.mod\n", got)
+
+    def test_method_scoped_from_import(self):
+        got = self.rewrite(
+            b'"""doc"""\n\n\nclass C:\n'
+            b"    def m(self):\n"
+            b"        from pkg.mod import X\n"
+            b"        return X\n",
+            [("pkg.mod", "new.mod")],
+        )
+        self.assertIn(b"        from new.mod import X\n", got)
+
+    @unittest.skipUnless(hasattr(ast, "Match"), "match statements need 3.10+")
+    def test_match_case_scoped_import_with_docstring(self):
+        got = self.rewrite(
+            b'"""doc"""\nmatch x:\n    case 1:\n        import pkg.mod\n',
+            [("pkg.mod", "new.mod")],
+        )
+        self.assertIn(b"        import new.mod\n", got)
+
+    def test_from_parent_import_renames_bound_name(self):
+        got = self.rewrite(b"from pkg import mod\n", [("pkg.mod", "new.mod")])
+        self.assertEqual(got, b"from new import mod\n")
+
+
+class TestBatchSemantics(RewriteFileBase):
+    """Both paths must resolve each statement against its original name."""
+
+    CHAINED = [("a", "b"), ("b", "c")]
+
+    def test_chained_batch_fast_path(self):
+        got = self.rewrite(b"import a\nimport b\n", self.CHAINED)
+        self.assertEqual(got, b"import b\nimport c\n")
+
+    def test_chained_batch_ast_path(self):
+        got = self.rewrite(b'"""d"""\nimport a\nimport b\n', self.CHAINED)
+        self.assertEqual(got, b'"""d"""\nimport b\nimport c\n')
+
+    def test_prefix_overlap_first_spec_wins(self):
+        renames = [("pkg.sub", "x.y"), ("pkg", "z")]
+        got = self.rewrite(b"import pkg.sub.mod\nimport pkg.other\n", renames)
+        self.assertEqual(got, b"import x.y.mod\nimport z.other\n")
+        got = self.rewrite(
+            b'"""d"""\nimport pkg.sub.mod\nimport pkg.other\n', renames
+        )
+        self.assertEqual(got, b'"""d"""\nimport x.y.mod\nimport z.other\n')
+
+    def test_old_name_substring_of_import_keyword(self):
+        got = self.rewrite(b"import imp\n", [("imp", "importlib")])
+        self.assertEqual(got, b"import importlib\n")
+
+    def test_single_letter_module(self):
+        got = self.rewrite(b"import t\n", [("t", "tests")])
+        self.assertEqual(got, b"import tests\n")
+
+    def test_old_name_substring_of_from_keyword(self):
+        got = self.rewrite(b"from rom import X\n", [("rom", "newrom")])
+        self.assertEqual(got, b"from newrom import X\n")
+
+    def test_noop_rename_leaves_file_alone(self):
+        content = b"import a.b\n"
+        path = self.root / "t.py"
+        path.write_bytes(content)
+        update_imports(self.root, "a.b", "a.b")
+        update_imports_many(self.root, [("a.b", "a.b")])
+        self.assertEqual(path.read_bytes(), content)
+
+
+class TestImportIndexCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.root = Path(self._tmp.name)
+        self._cache = tempfile.TemporaryDirectory()
+        self.addCleanup(self._cache.cleanup)
+        self._old_cache_home = os.environ.get("XDG_CACHE_HOME")
+        os.environ["XDG_CACHE_HOME"] = self._cache.name
+        self.addCleanup(self._restore_cache_home)
+        (self.root / "u.py").write_text("import pkg.a\n")
+
+    def _restore_cache_home(self):
+        if self._old_cache_home is None:
+            os.environ.pop("XDG_CACHE_HOME", None)
+        else:
+            os.environ["XDG_CACHE_HOME"] = self._old_cache_home
+
+    def test_load_tolerates_malformed_entries(self):
+        cache_file = Path(_index_cache_file())
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(
+            json.dumps(
+                {str(self.root): {"u.py": 5, "v.py": [1], "w.py": [1, 2, "x"]}}
+            )
+        )
+        index = ImportIndex.load(self.root)
+        self.assertIn(str(self.root / "u.py"), index.files_for("pkg"))
+
+    def test_save_and_reload_round_trip(self):
+        index = ImportIndex.load(self.root)
+        index.save()
+        reloaded = ImportIndex.load(self.root)
+        self.assertEqual(reloaded.by_top, index.by_top)
+
+
+class TestUpdateFileImports(RewriteFileBase):
+    def test_unmatched_file_is_untouched(self):
+        content = b"X = 42\n"
+        got = self.rewrite(content, [("pkg.mod", "new.mod")])
+        self.assertEqual(got, content)
+
+    def test_import_as_alias(self):
+        got = self.rewrite(
+            b"import pkg.mod as pm\n", [("pkg.mod", "new.mod")]
+        )
+        self.assertEqual(got, b"import new.mod as pm\n")
+
+    def test_single_pair_wrapper(self):
+        path = self.root / "w.py"
+        path.write_bytes(b"import pkg.mod\n")
+        update_file_imports(path, "pkg.mod", "new.mod", repo_root=self.root)
+        self.assertEqual(path.read_bytes(), b"import new.mod\n")
+
+
+if __name__ == "__main__":
+    unittest.main()